@@ -2,13 +2,33 @@
 import itertools
 import numbers
 from app.TimeZone import TimeZone
+from app.SnowflakeId import decode_transaction_id
 from datetime import datetime
 from collections import namedtuple
 
 
+class Confirmation(namedtuple('Confirmation', 'account_number transaction_code transaction_id time_utc time')):
+    """Result of Account.parse_confirmation_code.
+    `node` and `sequence` are only meaningful for ids made by app.SnowflakeId."""
+    __slots__ = ()
+
+    @property
+    def node(self):
+        return decode_transaction_id(self.transaction_id).node
+
+    @property
+    def sequence(self):
+        return decode_transaction_id(self.transaction_id).sequence
+
+
+_UTC = TimeZone(0, 0, 'UTC')
+
+
 class Account:
     transaction_counter = itertools.count(100)
     _interest_rate = 0.5
+    _clock = None  # None -> datetime.utcnow(), see set_clock
+    _transaction_listeners = ()
 
     _transaction_codes = {
         'deposit': 'D',
@@ -80,6 +100,36 @@ class Account:
             raise ValueError('Interest rate cannot be negative.')
         cls._interest_rate = value
 
+    @classmethod
+    def set_clock(cls, clock):
+        """Use `clock` (e.g. app.Clock.CoarseClock) for confirmation code timestamps.
+        Any object with a utc_timestamp() method returning YYYYMMDDHHMMSS works.
+        Pass None to go back to datetime.utcnow()."""
+        if clock is not None and not callable(getattr(clock, 'utc_timestamp', None)):
+            raise ValueError('Clock must have a utc_timestamp() method.')
+        cls._clock = clock
+
+    @classmethod
+    def add_transaction_listener(cls, listener):
+        """Call `listener(account, transaction_code, amount, confirmation_code)` after every
+        transaction, rejected withdrawals included (e.g. app.Journal.TransactionJournal)."""
+        if not callable(listener):
+            raise ValueError('Transaction listener must be callable.')
+        # listeners are shared by all accounts, whatever class they were registered through
+        Account._transaction_listeners = Account._transaction_listeners + (listener,)
+
+    @classmethod
+    def remove_transaction_listener(cls, listener):
+        listeners = list(Account._transaction_listeners)
+        if listener not in listeners:
+            raise ValueError('Transaction listener is not registered.')
+        listeners.remove(listener)
+        Account._transaction_listeners = tuple(listeners)
+
+    def _notify_transaction(self, transaction_code, amount, conf_code):
+        for listener in Account._transaction_listeners:
+            listener(self, transaction_code, amount, conf_code)
+
     def validate_and_set_name(self, property_name, value, field_title):
         """Refactoring Error for first_name and last_name"""
         if value is None or len(str(value).strip()) == 0:
@@ -97,17 +147,43 @@ class Account:
         # validation passed, return valid value
         return value
 
-    def generate_confirmation_code(self, transaction_code):
+    @staticmethod
+    def _validate_real_numbers(values, min_value=None):
+        """Batch version of validate_real_number - validates the whole sequence in one pass."""
+        values = list(values)
+        for value in values:
+            if not isinstance(value, numbers.Real):
+                raise ValueError('Value must be a real number.')
+        if values and min_value is not None and min(values) < min_value:
+            raise ValueError(f'Value must be at least {min_value}')
+        return values
+
+    @staticmethod
+    def _reserve_transaction_ids(count):
+        """Take a contiguous block of `count` transaction ids from the counter."""
+        counter = Account.transaction_counter
+        reserve = getattr(counter, 'reserve', None)
+        if reserve is not None:
+            # e.g. app.TransactionIdAllocator.BlockIdAllocator
+            return reserve(count)
+        return list(itertools.islice(counter, count))
+
+    @staticmethod
+    def _utc_timestamp():
         # main difficulty here is to generate the current time in UTC using this formatting:
         # YYYYMMDDHHMMSS
-        dt_str = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+        clock = Account._clock
+        if clock is None:
+            return datetime.utcnow().strftime('%Y%m%d%H%M%S')
+        return clock.utc_timestamp()
+
+    def generate_confirmation_code(self, transaction_code):
+        dt_str = Account._utc_timestamp()
         return f'{transaction_code}-{self.account_number}-{dt_str}-{next(Account.transaction_counter)}'
 
     @staticmethod
     def parse_confirmation_code(confirmation_code, preferred_time_zone=None):
         """Function that converts string confirmation number to separate pieces."""
-        Confirmation = namedtuple('Confirmation', 'account_number transaction_code transaction_id time_utc time')
-
         # dummy-A100-20190325224918-101
         parts = confirmation_code.split('-')
         if len(parts) != 4:
@@ -117,23 +193,31 @@ class Account:
         # unpack into separate variables
         transaction_code, account_number, raw_dt_utc, transaction_id = parts
 
-        # need to convert raw_dt_utc into a proper datetime object
+        # raw_dt_utc is fixed width YYYYMMDDHHMMSS - slicing it is much cheaper than strptime
+        if len(raw_dt_utc) != 14 or not (raw_dt_utc.isascii() and raw_dt_utc.isdigit()):
+            raise ValueError('Invalid transaction datetime')
+        year, month, day = raw_dt_utc[0:4], raw_dt_utc[4:6], raw_dt_utc[6:8]
+        hour, minute, second = raw_dt_utc[8:10], raw_dt_utc[10:12], raw_dt_utc[12:14]
         try:
-            dt_utc = datetime.strptime(raw_dt_utc, '%Y%m%d%H%M%S')
+            # still build the datetime, it validates the calendar values
+            dt_utc = datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
         except ValueError as ex:
-            # again, probably need better error handling here
             raise ValueError('Invalid transaction datetime') from ex  # keep stacktrace too
 
         if preferred_time_zone is None:
-            preferred_time_zone = TimeZone(0, 0, 'UTC')
+            preferred_time_zone = _UTC
 
         if not isinstance(preferred_time_zone, TimeZone):
             raise ValueError('Invalid TimeZone specified.')
 
-        dt_preferred = dt_utc + preferred_time_zone.offset
-        dt_preferred_str = f"{dt_preferred.strftime('%Y-%m-%d %H:%M:%S')} ({preferred_time_zone.name})"
+        offset = preferred_time_zone.offset
+        if offset:
+            dt_preferred_str = f"{(dt_utc + offset).isoformat(' ')} ({preferred_time_zone.name})"
+        else:
+            dt_preferred_str = f"{year}-{month}-{day} {hour}:{minute}:{second} ({preferred_time_zone.name})"
 
-        return Confirmation(account_number, transaction_code, transaction_id, dt_utc.isoformat(), dt_preferred_str)
+        return Confirmation(account_number, transaction_code, transaction_id,
+                            f'{year}-{month}-{day}T{hour}:{minute}:{second}', dt_preferred_str)
 
     def deposit(self, value):
         # validate for real and negative numbers
@@ -146,6 +230,8 @@ class Account:
 
         # make deposit and return conf code
         self._balance += value
+        if Account._transaction_listeners:
+            self._notify_transaction(transaction_code, value, conf_code)
         return conf_code
 
     def withdrawal(self, value):
@@ -164,14 +250,71 @@ class Account:
 
         if accepted:
             self._balance -= value
+        if Account._transaction_listeners:
+            self._notify_transaction(transaction_code, value, conf_code)
         return conf_code
 
     def pay_interest(self):
         interest = self.balance * Account.get_interest_rate() / 100
-        conf_code = self.generate_confirmation_code(Account._transaction_codes['interest'])
+        transaction_code = Account._transaction_codes['interest']
+        conf_code = self.generate_confirmation_code(transaction_code)
         self._balance += interest
+        if Account._transaction_listeners:
+            self._notify_transaction(transaction_code, interest, conf_code)
         return conf_code
 
+    def deposit_many(self, values):
+        """Apply a batch of deposits and return their confirmation codes (in order)."""
+        values = Account._validate_real_numbers(values, min_value=0.01)
+        if not values:
+            return []
+
+        # one timestamp and one block of ids for the whole batch
+        dt_str = Account._utc_timestamp()
+        transaction_ids = Account._reserve_transaction_ids(len(values))
+        prefix = f"{Account._transaction_codes['deposit']}-{self.account_number}-{dt_str}-"
+
+        balance = self._balance
+        for value in values:
+            balance += value
+        self._balance = balance
+        conf_codes = [f'{prefix}{transaction_id}' for transaction_id in transaction_ids]
+        if Account._transaction_listeners:
+            transaction_code = Account._transaction_codes['deposit']
+            for value, conf_code in zip(values, conf_codes):
+                self._notify_transaction(transaction_code, value, conf_code)
+        return conf_codes
+
+    def withdraw_many(self, values):
+        """Apply a batch of withdrawals in order and return their confirmation codes.
+        Withdrawals that would overdraw the account are rejected (`X`) as in withdrawal()."""
+        values = Account._validate_real_numbers(values, min_value=0.01)
+        if not values:
+            return []
+
+        dt_str = Account._utc_timestamp()
+        transaction_ids = Account._reserve_transaction_ids(len(values))
+        suffix = f'-{self.account_number}-{dt_str}-'
+        withdraw_code = Account._transaction_codes['withdraw']
+        rejected_code = Account._transaction_codes['rejected']
+
+        balance = self._balance
+        conf_codes = []
+        transaction_codes = []
+        for value, transaction_id in zip(values, transaction_ids):
+            if balance - value < 0:
+                transaction_code = rejected_code
+            else:
+                transaction_code = withdraw_code
+                balance -= value
+            transaction_codes.append(transaction_code)
+            conf_codes.append(f'{transaction_code}{suffix}{transaction_id}')
+        self._balance = balance
+        if Account._transaction_listeners:
+            for transaction_code, value, conf_code in zip(transaction_codes, values, conf_codes):
+                self._notify_transaction(transaction_code, value, conf_code)
+        return conf_codes
+
     def __eq__(self, other):
         """This is needed if we want to compare TimeZones()"""
         return (isinstance(other, Account) and
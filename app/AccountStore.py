@@ -0,0 +1,137 @@
+"""Columnar storage for large numbers of accounts.
+
+Instead of one `Account` instance (and its `__dict__`) per account, the store keeps
+every field in its own column and hands out lightweight `AccountView` objects that
+behave like `Account` instances, e.g.:
+
+    store = AccountStore()
+    a = store.add('A100', 'Eric', 'Idle', TimeZone(-7, 0, 'MST'), 100)
+    a.deposit(50)
+    store['A100'].balance  # 150
+"""
+from array import array
+from app.Account import Account
+from app.TimeZone import TimeZone
+
+
+class AccountView(Account):
+    """`Account`-compatible view of one row of an AccountStore.
+
+    The private attributes used by `Account` (`_balance`, `_first_name`, ...) are
+    redirected to the store columns, so all `Account` methods work unchanged."""
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store, row):
+        # intentionally not calling Account.__init__ - the row is already validated
+        self._store = store
+        self._row = row
+
+    @property
+    def _account_number(self):
+        return self._store._account_numbers[self._row]
+
+    @property
+    def _first_name(self):
+        return self._store._first_names[self._row]
+
+    @_first_name.setter
+    def _first_name(self, value):
+        self._store._first_names[self._row] = value
+
+    @property
+    def _last_name(self):
+        return self._store._last_names[self._row]
+
+    @_last_name.setter
+    def _last_name(self, value):
+        self._store._last_names[self._row] = value
+
+    @property
+    def _timezone(self):
+        return self._store._timezones[self._store._timezone_codes[self._row]]
+
+    @_timezone.setter
+    def _timezone(self, value):
+        self._store._timezone_codes[self._row] = self._store._timezone_code(value)
+
+    @property
+    def _balance(self):
+        return self._store._balances[self._row]
+
+    @_balance.setter
+    def _balance(self, value):
+        self._store._balances[self._row] = value
+
+    def __repr__(self):
+        return f"AccountView(account_number='{self.account_number}', row={self._row})"
+
+
+class AccountStore:
+    """Keeps account fields in array-backed columns, one row per account."""
+
+    def __init__(self):
+        self._account_numbers = []
+        self._first_names = []
+        self._last_names = []
+        self._timezone_codes = array('H')  # index into self._timezones
+        self._balances = array('d')  # float64, same semantics as Account._balance
+        self._timezones = []
+        self._timezone_index = {}
+        self._rows = {}
+
+    def _timezone_code(self, timezone):
+        if not isinstance(timezone, TimeZone):
+            raise ValueError('Time zone must be a valid TimeZone object.')
+        key = (timezone._offset_hours, timezone._offset_minutes, timezone.name)
+        code = self._timezone_index.get(key)
+        if code is None:
+            code = len(self._timezones)
+            self._timezones.append(timezone)
+            self._timezone_index[key] = code
+        return code
+
+    def add(self, account_number, first_name, last_name, timezone=None, initial_balance=0):
+        """Add a new account and return its view. Arguments are the same as for `Account`."""
+        if account_number in self._rows:
+            raise ValueError(f'Account {account_number} already exists.')
+        for value, field_title in ((first_name, 'First Name'), (last_name, 'Last Name')):
+            if value is None or len(str(value).strip()) == 0:
+                raise ValueError(f'{field_title} cannot be empty.')
+        if timezone is None:
+            timezone = TimeZone(0, 0, 'UTC')
+        timezone_code = self._timezone_code(timezone)
+        balance = Account.validate_real_number(initial_balance, 0.01)
+
+        row = len(self._account_numbers)
+        self._account_numbers.append(account_number)
+        self._first_names.append(first_name)
+        self._last_names.append(last_name)
+        self._timezone_codes.append(timezone_code)
+        self._balances.append(balance)
+        self._rows[account_number] = row
+        return AccountView(self, row)
+
+    def add_account(self, account):
+        """Copy an existing `Account` into the store and return its view."""
+        return self.add(account.account_number, account.first_name, account.last_name,
+                        account.timezone, account.balance)
+
+    @property
+    def balances(self):
+        """Read-only view of the balance column (in row order)."""
+        return memoryview(self._balances).toreadonly()
+
+    def row_of(self, account_number):
+        return self._rows[account_number]
+
+    def __getitem__(self, account_number):
+        return AccountView(self, self._rows[account_number])
+
+    def __contains__(self, account_number):
+        return account_number in self._rows
+
+    def __len__(self):
+        return len(self._account_numbers)
+
+    def __iter__(self):
+        return (AccountView(self, row) for row in range(len(self._account_numbers)))
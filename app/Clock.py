@@ -0,0 +1,74 @@
+"""Clocks for confirmation code timestamps.
+
+The timestamp in a confirmation code only has a resolution of one second, so
+`CoarseClock` formats it once per second and hands out the cached string in between.
+Install it with `Account.set_clock(CoarseClock())`.
+
+For tests, drive it with a `FakeClock`:
+
+    fake = FakeClock(datetime(2019, 3, 15, 14, 59, 0))
+    Account.set_clock(CoarseClock(fake))
+    fake.advance(60)
+"""
+import time
+import calendar
+from functools import lru_cache
+from datetime import datetime
+
+
+class CoarseClock:
+    """UTC time as a YYYYMMDDHHMMSS string, reformatted only when the second rolls over.
+
+    `time_source` is a callable returning the current time as POSIX seconds
+    (defaults to time.time)."""
+
+    def __init__(self, time_source=time.time):
+        if not callable(time_source):
+            raise ValueError('Time source must be callable.')
+        self._time_source = time_source
+        # (second, formatted) kept in one tuple so a reader never sees a half updated cache
+        self._cache = (None, None)
+
+    def utc_timestamp(self):
+        second = int(self._time_source())
+        cached_second, formatted = self._cache
+        if second != cached_second:
+            formatted = time.strftime('%Y%m%d%H%M%S', time.gmtime(second))
+            self._cache = (second, formatted)
+        return formatted
+
+
+class FakeClock:
+    """Manually driven time source. Calling the instance returns the current fake
+    POSIX time, so it can be passed to CoarseClock as `time_source`."""
+
+    def __init__(self, start=0):
+        self.set(start)
+
+    @staticmethod
+    def _to_seconds(value):
+        if isinstance(value, datetime):
+            # naive datetimes are taken to be UTC, like datetime.utcnow()
+            if value.tzinfo is not None:
+                return value.timestamp()
+            return calendar.timegm(value.timetuple()) + value.microsecond / 1_000_000
+        if isinstance(value, (int, float)):
+            return value
+        raise ValueError('Time must be a datetime or a number of seconds.')
+
+    def set(self, value):
+        self._now = self._to_seconds(value)
+
+    def advance(self, seconds):
+        self._now += seconds
+
+    def __call__(self):
+        return self._now
+
+
+@lru_cache(maxsize=1024)
+def timestamp_to_epoch(raw_dt_utc):
+    """POSIX seconds of a YYYYMMDDHHMMSS UTC timestamp (as used in confirmation codes).
+    Cached, because consecutive transactions mostly share the same second."""
+    return calendar.timegm((int(raw_dt_utc[0:4]), int(raw_dt_utc[4:6]), int(raw_dt_utc[6:8]),
+                            int(raw_dt_utc[8:10]), int(raw_dt_utc[10:12]), int(raw_dt_utc[12:14])))
@@ -0,0 +1,81 @@
+"""Streaming decoder for files / streams of confirmation codes (one code per line).
+
+Files are read in large binary chunks, so memory use does not depend on the file size.
+Malformed lines do not stop the stream - they are reported as `InvalidConfirmation`
+records to the `on_error` callback (or as warnings when no callback is given)."""
+import os
+import warnings
+from collections import namedtuple
+from app.Account import Account
+
+InvalidConfirmation = namedtuple('InvalidConfirmation', 'line_number offset line error')
+
+ConfirmationBatch = namedtuple('ConfirmationBatch',
+                               'account_numbers transaction_codes transaction_ids times_utc times')
+
+CHUNK_SIZE = 1 << 20
+
+
+def _read_lines(path, chunk_size):
+    """Yield (line_number, byte_offset, raw_line) for a file, reading it in chunks."""
+    line_number = 0
+    offset = 0
+    tail = b''
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            lines = (tail + chunk).split(b'\n')
+            tail = lines.pop()
+            for line in lines:
+                line_number += 1
+                yield line_number, offset, line
+                offset += len(line) + 1
+    if tail:
+        yield line_number + 1, offset, tail
+
+
+def _iter_lines(source, chunk_size):
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return _read_lines(source, chunk_size)
+    # any other iterable of lines - byte offsets are unknown
+    return ((line_number, None, line) for line_number, line in enumerate(source, start=1))
+
+
+def _report(on_error, invalid):
+    if on_error is None:
+        warnings.warn(f'Invalid confirmation code on line {invalid.line_number}: {invalid.error}')
+    else:
+        on_error(invalid)
+
+
+def iter_confirmation_codes(source, preferred_time_zone=None, on_error=None, chunk_size=CHUNK_SIZE):
+    """Parse every confirmation code in `source` (a file path or an iterable of lines)
+    and yield `Confirmation` records, as returned by `Account.parse_confirmation_code`.
+    Blank lines are skipped."""
+    parse = Account.parse_confirmation_code
+    for line_number, offset, line in _iter_lines(source, chunk_size):
+        try:
+            if isinstance(line, bytes):
+                line = line.decode('ascii')
+            line = line.strip()
+            if not line:
+                continue
+            yield parse(line, preferred_time_zone)
+        except ValueError as ex:  # UnicodeDecodeError is a ValueError too
+            _report(on_error, InvalidConfirmation(line_number, offset, line, str(ex)))
+
+
+def iter_confirmation_batches(source, batch_size=10_000, preferred_time_zone=None, on_error=None,
+                              chunk_size=CHUNK_SIZE):
+    """Same as iter_confirmation_codes but yields `ConfirmationBatch` records holding
+    up to `batch_size` parsed codes as columns (one list per field)."""
+    if batch_size < 1:
+        raise ValueError('Batch size must be at least 1.')
+    records = iter_confirmation_codes(source, preferred_time_zone, on_error, chunk_size)
+    while True:
+        batch = [record for _, record in zip(range(batch_size), records)]
+        if not batch:
+            return
+        yield ConfirmationBatch(*(list(column) for column in zip(*batch)))
@@ -0,0 +1,93 @@
+"""Month-end interest run over many accounts at once.
+
+`pay_interest_all` applies `Account.get_interest_rate()` to every balance in one pass,
+reserves one contiguous block of `I` transaction ids for the whole run and only builds
+confirmation codes when they are asked for."""
+from array import array
+from app.Account import Account
+from app.AccountStore import AccountStore, AccountView
+
+
+class InterestRun:
+    """Result of a bulk interest run. Behaves like a read-only sequence of
+    confirmation codes (one per account, in the order the accounts were paid)."""
+
+    def __init__(self, account_numbers, dt_str, transaction_ids, interest_rate):
+        self._account_numbers = account_numbers
+        self._dt_str = dt_str
+        self._transaction_ids = transaction_ids
+        self._interest_rate = interest_rate
+        self._index = None
+
+    @property
+    def interest_rate(self):
+        return self._interest_rate
+
+    @property
+    def transaction_ids(self):
+        return self._transaction_ids
+
+    def _code(self, index):
+        return (f"{Account._transaction_codes['interest']}-{self._account_numbers[index]}-"
+                f"{self._dt_str}-{self._transaction_ids[index]}")
+
+    def confirmation_code(self, account_number):
+        """Confirmation code of the interest payment for `account_number`."""
+        if self._index is None:
+            self._index = {number: i for i, number in enumerate(self._account_numbers[:len(self)])}
+        return self._code(self._index[account_number])
+
+    def __len__(self):
+        return len(self._transaction_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._code(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('InterestRun index out of range')
+        return self._code(index)
+
+    def __iter__(self):
+        return (self._code(i) for i in range(len(self)))
+
+    def __repr__(self):
+        return f'InterestRun(accounts={len(self)}, interest_rate={self._interest_rate})'
+
+
+def _compound(balances, rate):
+    # same arithmetic as Account.pay_interest, so results are identical
+    return [balance + balance * rate / 100 for balance in balances]
+
+
+def pay_interest_all(accounts):
+    """Pay interest to every account in `accounts` (an AccountStore or an iterable of
+    Account objects) and return an InterestRun."""
+    rate = Account.get_interest_rate()
+    dt_str = Account._utc_timestamp()
+
+    if isinstance(accounts, AccountStore):
+        store = accounts
+        count = len(store)
+        old_balances = store._balances[:count]
+        store._balances[:count] = array('d', _compound(old_balances, rate))
+        account_numbers = store._account_numbers
+        if Account._transaction_listeners:
+            accounts = [AccountView(store, row) for row in range(count)]
+    else:
+        accounts = list(accounts)
+        count = len(accounts)
+        old_balances = [account.balance for account in accounts]
+        for account, balance in zip(accounts, _compound(old_balances, rate)):
+            account._balance = balance
+        account_numbers = [account.account_number for account in accounts]
+
+    transaction_ids = Account._reserve_transaction_ids(count)
+    run = InterestRun(account_numbers, dt_str, transaction_ids, rate)
+    if Account._transaction_listeners:
+        # listeners need every confirmation code, so laziness is lost here
+        transaction_code = Account._transaction_codes['interest']
+        for index, (account, old_balance) in enumerate(zip(accounts, old_balances)):
+            account._notify_transaction(transaction_code, old_balance * rate / 100, run[index])
+    return run
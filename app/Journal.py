@@ -0,0 +1,129 @@
+"""Append-only transaction journal.
+
+Every transaction is written as one line `<confirmation code>\\t<amount>` to a local file:
+
+    journal = TransactionJournal('ledger.journal', commit_every=100, commit_interval=0.01)
+    journal.attach()   # journal every Account transaction from now on
+    ...
+    journal.close()
+
+Group commit: records are buffered and written + fsync-ed together once
+`commit_every` records are pending or `commit_interval` seconds have passed, so many
+transactions share one fsync. With the defaults (commit_every=1) every transaction is
+durable before its confirmation code is returned.
+"""
+import os
+import threading
+from collections import namedtuple
+from app.Account import Account
+
+JournalRecord = namedtuple('JournalRecord',
+                           'transaction_code account_number transaction_id amount confirmation_code')
+
+
+class TransactionJournal:
+    def __init__(self, path, commit_every=1, commit_interval=None):
+        if not isinstance(commit_every, int) or commit_every < 1:
+            raise ValueError('commit_every must be a positive integer.')
+        if commit_interval is not None and commit_interval <= 0:
+            raise ValueError('commit_interval must be positive.')
+        self._path = os.fspath(path)
+        self._file = open(self._path, 'ab')
+        self._commit_every = commit_every
+        self._pending = []
+        self._lock = threading.Lock()
+        self._attached = False
+        self._closed = threading.Event()
+        self._flusher = None
+        if commit_interval is not None:
+            self._flusher = threading.Thread(target=self._flush_periodically, args=(commit_interval,),
+                                             name='TransactionJournal-flusher', daemon=True)
+            self._flusher.start()
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def pending(self):
+        """Number of records not yet written to disk."""
+        return len(self._pending)
+
+    def _flush_periodically(self, interval):
+        while not self._closed.wait(interval):
+            self.sync()
+
+    def append(self, confirmation_code, amount):
+        """Journal one transaction."""
+        if self._closed.is_set():
+            raise ValueError('Journal is closed.')
+        with self._lock:
+            self._pending.append(f'{confirmation_code}\t{float(amount)!r}\n')
+            if len(self._pending) >= self._commit_every:
+                self._commit()
+
+    def __call__(self, account, transaction_code, amount, confirmation_code):
+        """Transaction listener interface, see Account.add_transaction_listener."""
+        self.append(confirmation_code, amount)
+
+    def _commit(self):
+        # caller holds self._lock
+        if not self._pending:
+            return
+        self._file.write(''.join(self._pending).encode('ascii'))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending.clear()
+
+    def sync(self):
+        """Write and fsync all pending records."""
+        with self._lock:
+            if not self._file.closed:
+                self._commit()
+
+    def tell(self):
+        """Byte position just after the last committed record."""
+        with self._lock:
+            self._commit()
+            return self._file.tell()
+
+    def attach(self):
+        """Start journaling all Account transactions."""
+        if not self._attached:
+            Account.add_transaction_listener(self)
+            self._attached = True
+
+    def detach(self):
+        if self._attached:
+            Account.remove_transaction_listener(self)
+            self._attached = False
+
+    def close(self):
+        self.detach()
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            if not self._file.closed:
+                self._commit()
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_journal(path, offset=0):
+    """Yield the JournalRecords of a journal file, starting at byte `offset`.
+    A torn last line (crash while writing) is ignored."""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            confirmation_code, amount = line.decode('ascii').rstrip('\n').split('\t')
+            transaction_code, account_number, _, transaction_id = confirmation_code.split('-')
+            yield JournalRecord(transaction_code, account_number, int(transaction_id), float(amount),
+                                confirmation_code)
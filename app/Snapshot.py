@@ -0,0 +1,125 @@
+"""Compact binary snapshots of account balances, plus fast restart from snapshot + journal.
+
+    journal = TransactionJournal('ledger.journal')
+    journal.attach()
+    ...
+    checkpoint('ledger.snapshot', accounts, journal)        # e.g. every few minutes
+
+and after a restart (accounts = {account_number: Account} or an AccountStore):
+
+    recover(accounts, 'ledger.snapshot', 'ledger.journal')
+
+Recovery loads the snapshot and replays only the journal records written after it, so
+restart time depends on the activity since the last checkpoint, not on total history.
+Transactions must not run while `checkpoint` is taking the snapshot.
+"""
+import os
+import struct
+import itertools
+from collections import namedtuple
+from app.Account import Account
+from app.Journal import read_journal
+
+MAGIC = b'BASN'
+VERSION = 1
+_header = struct.Struct('<4sHqqI')  # magic, version, journal offset, next transaction id, count
+_entry = struct.Struct('<Hd')  # account number length, balance
+
+Snapshot = namedtuple('Snapshot', 'journal_offset next_transaction_id balances')
+RecoveryResult = namedtuple('RecoveryResult', 'snapshot_accounts replayed next_transaction_id unknown_accounts')
+
+
+def _next_transaction_id():
+    counter = Account.transaction_counter
+    high_water_mark = getattr(counter, 'high_water_mark', None)
+    if high_water_mark is not None:
+        # app.TransactionIdAllocator.BlockIdAllocator
+        return high_water_mark.value
+    # itertools.count cannot be peeked - this id is simply never used
+    return next(counter)
+
+
+def write_snapshot(path, accounts, journal_offset=0, next_transaction_id=None):
+    """Atomically write the balances of `accounts` (iterable of Account, a dict of them
+    or an AccountStore) to `path`."""
+    if hasattr(accounts, 'values'):
+        accounts = accounts.values()
+    if next_transaction_id is None:
+        next_transaction_id = _next_transaction_id()
+    path = os.fspath(path)
+    entries = []
+    for account in accounts:
+        account_number = str(account.account_number).encode('utf-8')
+        entries.append(_entry.pack(len(account_number), account.balance))
+        entries.append(account_number)
+
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_header.pack(MAGIC, VERSION, journal_offset, next_transaction_id, len(entries) // 2))
+        f.write(b''.join(entries))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < _header.size:
+        raise ValueError('Invalid snapshot file.')
+    magic, version, journal_offset, next_transaction_id, count = _header.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('Invalid snapshot file.')
+    balances = {}
+    position = _header.size
+    for _ in range(count):
+        length, balance = _entry.unpack_from(data, position)
+        position += _entry.size
+        balances[data[position:position + length].decode('utf-8')] = balance
+        position += length
+    return Snapshot(journal_offset, next_transaction_id, balances)
+
+
+def checkpoint(path, accounts, journal):
+    """Snapshot `accounts` together with the current end of `journal`."""
+    write_snapshot(path, accounts, journal_offset=journal.tell())
+
+
+def recover(accounts, snapshot_path, journal_path, restore_counter=True):
+    """Restore balances of `accounts` (mapping of account number to Account, e.g. a dict
+    or an AccountStore) from the latest snapshot and the journal tail after it.
+    Either file may be missing. Unless restore_counter is False, an itertools.count
+    Account.transaction_counter continues after the highest id seen (allocators with
+    their own persistent state are left alone)."""
+    if snapshot_path is not None and os.path.exists(snapshot_path):
+        snapshot = read_snapshot(snapshot_path)
+    else:
+        snapshot = Snapshot(0, 0, {})
+
+    unknown_accounts = set()
+    for account_number, balance in snapshot.balances.items():
+        if account_number in accounts:
+            accounts[account_number]._balance = balance
+        else:
+            unknown_accounts.add(account_number)
+
+    next_transaction_id = snapshot.next_transaction_id
+    replayed = 0
+    if journal_path is not None and os.path.exists(journal_path):
+        codes = Account._transaction_codes
+        for record in read_journal(journal_path, snapshot.journal_offset):
+            replayed += 1
+            next_transaction_id = max(next_transaction_id, record.transaction_id + 1)
+            if record.account_number not in accounts:
+                unknown_accounts.add(record.account_number)
+                continue
+            account = accounts[record.account_number]
+            if record.transaction_code in (codes['deposit'], codes['interest']):
+                account._balance += record.amount
+            elif record.transaction_code == codes['withdraw']:
+                account._balance -= record.amount
+            # rejected transactions did not change the balance
+
+    if restore_counter and next_transaction_id and isinstance(Account.transaction_counter, itertools.count):
+        Account.transaction_counter = itertools.count(next_transaction_id)
+    return RecoveryResult(len(snapshot.balances), replayed, next_transaction_id, unknown_accounts)
@@ -0,0 +1,127 @@
+"""Per-account transaction history with time-range queries.
+
+    history = TransactionHistoryRecorder()
+    history.attach()            # record every Account transaction from now on
+    ...
+    history.query('A100', datetime(2019, 3, 1), datetime(2019, 4, 1), transaction_code='W')
+
+Each account keeps, per transaction code, parallel arrays of UTC epoch seconds, amount
+and transaction id sorted by time, so a range query is two bisects plus the k matches:
+O(log n + k), without re-parsing confirmation codes.
+"""
+import calendar
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from datetime import datetime
+from app.Account import Account
+from app.Clock import timestamp_to_epoch
+
+HistoryEntry = namedtuple('HistoryEntry', 'time_utc transaction_code amount transaction_id')
+
+
+def _to_epoch(value):
+    if isinstance(value, datetime):
+        # naive datetimes are UTC, like the times in confirmation codes
+        if value.tzinfo is not None:
+            return int(value.timestamp())
+        return calendar.timegm(value.timetuple())
+    return value
+
+
+class _Columns:
+    __slots__ = ('epochs', 'amounts', 'transaction_ids')
+
+    def __init__(self):
+        self.epochs = array('q')
+        self.amounts = array('d')
+        self.transaction_ids = array('q')
+
+
+class TransactionHistory:
+    """Transaction history of one account."""
+
+    def __init__(self):
+        self._columns = {}
+
+    def append(self, time_utc, transaction_code, amount, transaction_id):
+        """Add a transaction; `time_utc` is a datetime (UTC) or POSIX seconds."""
+        epoch = _to_epoch(time_utc)
+        columns = self._columns.get(transaction_code)
+        if columns is None:
+            columns = self._columns[transaction_code] = _Columns()
+        epochs = columns.epochs
+        if not epochs or epoch >= epochs[-1]:
+            epochs.append(epoch)
+            columns.amounts.append(amount)
+            columns.transaction_ids.append(transaction_id)
+        else:
+            # out of order (e.g. clock adjustment) - rare, keep the arrays sorted
+            index = bisect_right(epochs, epoch)
+            epochs.insert(index, epoch)
+            columns.amounts.insert(index, amount)
+            columns.transaction_ids.insert(index, transaction_id)
+
+    def _range(self, transaction_code, columns, start, end):
+        epochs = columns.epochs
+        low = 0 if start is None else bisect_left(epochs, start)
+        high = len(epochs) if end is None else bisect_right(epochs, end)
+        amounts, transaction_ids = columns.amounts, columns.transaction_ids
+        return (HistoryEntry(epochs[i], transaction_code, amounts[i], transaction_ids[i]) for i in range(low, high))
+
+    def query(self, start=None, end=None, transaction_code=None):
+        """Transactions with start <= time_utc <= end (both optional, datetime or POSIX
+        seconds), optionally only of one transaction code, sorted by time."""
+        start, end = _to_epoch(start), _to_epoch(end)
+        if transaction_code is not None:
+            columns = self._columns.get(transaction_code)
+            if columns is None:
+                return []
+            return list(self._range(transaction_code, columns, start, end))
+        ranges = [self._range(code, columns, start, end) for code, columns in self._columns.items()]
+        return list(heapq.merge(*ranges, key=lambda entry: (entry.time_utc, entry.transaction_id)))
+
+    def __len__(self):
+        return sum(len(columns.epochs) for columns in self._columns.values())
+
+    def __iter__(self):
+        return iter(self.query())
+
+
+class TransactionHistoryRecorder:
+    """Transaction listener that keeps a TransactionHistory for every account."""
+
+    def __init__(self):
+        self._histories = {}
+        self._attached = False
+
+    def __call__(self, account, transaction_code, amount, confirmation_code):
+        _, raw_dt_utc, transaction_id = confirmation_code.rsplit('-', 2)
+        self.history(account.account_number, create=True).append(
+            timestamp_to_epoch(raw_dt_utc), transaction_code, amount, int(transaction_id))
+
+    def history(self, account_number, create=False):
+        history = self._histories.get(account_number)
+        if history is None:
+            if not create:
+                raise KeyError(account_number)
+            history = self._histories[account_number] = TransactionHistory()
+        return history
+
+    def query(self, account_number, start=None, end=None, transaction_code=None):
+        """See TransactionHistory.query. Unknown accounts have no transactions."""
+        history = self._histories.get(account_number)
+        if history is None:
+            return []
+        return history.query(start, end, transaction_code)
+
+    def attach(self):
+        if not self._attached:
+            Account.add_transaction_listener(self)
+            self._attached = True
+
+    def detach(self):
+        if self._attached:
+            Account.remove_transaction_listener(self)
+            self._attached = False
@@ -0,0 +1,183 @@
+"""Transaction id allocation for many threads / worker processes.
+
+`BlockIdAllocator` can replace `Account.transaction_counter`:
+
+    Account.transaction_counter = BlockIdAllocator(FileHighWaterMark('ids.hwm'))
+
+Every thread reserves a block of ids from a shared high-water mark and then draws
+ids from its own block without any locking. The high-water mark decides how far the
+allocation is shared:
+- LocalHighWaterMark  - threads of a single process
+- SharedHighWaterMark - processes started (via multiprocessing) from one parent
+- FileHighWaterMark   - any processes that use the same file, also across restarts
+
+Ids are unique and roughly increasing (each thread works through its own block).
+"""
+import os
+import struct
+import threading
+import weakref
+import multiprocessing
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class LocalHighWaterMark:
+    """In-process high-water mark."""
+
+    def __init__(self, start=100):
+        self._next = start
+        self._lock = threading.Lock()
+
+    def reserve(self, count):
+        """Reserve `count` ids and return the first one."""
+        with self._lock:
+            start = self._next
+            self._next += count
+        return start
+
+    @property
+    def value(self):
+        """The next id that has not been handed out yet."""
+        return self._next
+
+
+class SharedHighWaterMark:
+    """High-water mark in shared memory. Pass the instance to worker processes
+    (e.g. as a multiprocessing.Process argument) before they start."""
+
+    def __init__(self, start=100, context=None):
+        context = context or multiprocessing
+        self._next = context.Value('q', start)
+
+    def reserve(self, count):
+        with self._next.get_lock():
+            start = self._next.value
+            self._next.value = start + count
+        return start
+
+    @property
+    def value(self):
+        return self._next.value
+
+
+class FileHighWaterMark:
+    """High-water mark stored as an 8 byte integer in a file, protected by an OS file
+    lock. Works for unrelated processes and survives restarts."""
+    _format = struct.Struct('<q')
+
+    def __init__(self, path, start=100):
+        self._path = os.fspath(path)
+        self._start = start
+        # 'a+b' creates the file without truncating an existing one
+        with open(self._path, 'a+b'):
+            pass
+
+    @staticmethod
+    def _lock(f):
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, FileHighWaterMark._format.size)
+
+    @staticmethod
+    def _unlock(f):
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, FileHighWaterMark._format.size)
+
+    def _read(self, f):
+        f.seek(0)
+        data = f.read(self._format.size)
+        if len(data) < self._format.size:
+            return self._start
+        return self._format.unpack(data)[0]
+
+    def reserve(self, count):
+        with open(self._path, 'r+b') as f:
+            self._lock(f)
+            try:
+                start = self._read(f)
+                f.seek(0)
+                f.write(self._format.pack(start + count))
+                f.flush()
+            finally:
+                self._unlock(f)
+        return start
+
+    @property
+    def value(self):
+        with open(self._path, 'rb') as f:
+            return self._read(f)
+
+
+def _call_weak(weak_method):
+    """Callback for os.register_at_fork that does not keep its allocator alive."""
+    def callback():
+        method = weak_method()
+        if method is not None:
+            method()
+    return callback
+
+
+class BlockIdAllocator:
+    """Iterator of unique transaction ids, drop-in replacement for itertools.count.
+
+    Each thread takes `block_size` ids at a time from `high_water_mark` and hands
+    them out locally. Blocks are dropped in a forked child so parent and child never
+    share a block."""
+
+    def __init__(self, high_water_mark=None, block_size=1000):
+        if not isinstance(block_size, int) or block_size < 1:
+            raise ValueError('Block size must be a positive integer.')
+        if high_water_mark is None:
+            high_water_mark = LocalHighWaterMark()
+        self._high_water_mark = high_water_mark
+        self._block_size = block_size
+        self._init_local()
+
+    def _init_local(self):
+        self._local = threading.local()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=_call_weak(weakref.WeakMethod(self._reset_after_fork)))
+
+    def _reset_after_fork(self):
+        self._local = threading.local()
+
+    def __getstate__(self):
+        # blocks are per thread and per process - a pickled copy (e.g. sent to a
+        # spawned worker) starts without one
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_local()
+
+    @property
+    def high_water_mark(self):
+        return self._high_water_mark
+
+    def reserve(self, count):
+        """Reserve `count` contiguous ids (used for batch transactions) as a range."""
+        start = self._high_water_mark.reserve(count)
+        return range(start, start + count)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        local = self._local
+        try:
+            return next(local.block)
+        except (AttributeError, StopIteration):
+            local.block = iter(self.reserve(self._block_size))
+            return next(local.block)
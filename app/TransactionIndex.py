@@ -0,0 +1,116 @@
+"""Global lookup of transactions by transaction id / confirmation code.
+
+    index = TransactionIndex()
+    index.attach()          # index every Account transaction from now on
+    ...
+    record = index.lookup('D-140568-20190315145900-124')
+    record.account.balance
+
+Transaction ids from `Account.transaction_counter` are (nearly) consecutive, so records
+are kept in dense parallel arrays addressed by `transaction_id - base` - about 21 bytes
+per transaction and an O(1) lookup without hashing. Ids far outside the dense range
+(e.g. snowflake ids) go to a dict instead.
+"""
+from array import array
+from collections import namedtuple
+from app.Account import Account
+from app.Clock import timestamp_to_epoch
+
+TransactionRecord = namedtuple('TransactionRecord', 'transaction_id transaction_code account amount time_utc')
+
+_EMPTY = -1
+
+
+class TransactionIndex:
+    def __init__(self, max_gap=1 << 20):
+        """`max_gap`: how far past the dense range an id may be and still grow it."""
+        self._max_gap = max_gap
+        self._base = None
+        self._account_slots = array('i')  # index into self._accounts, _EMPTY for unused ids
+        self._codes = bytearray()
+        self._amounts = array('d')
+        self._epochs = array('q')
+        self._sparse = {}
+        self._accounts = []
+        self._slot_of = {}
+        self._attached = False
+
+    def _slot(self, account):
+        slot = self._slot_of.get(account.account_number)
+        if slot is None:
+            slot = self._slot_of[account.account_number] = len(self._accounts)
+            self._accounts.append(account)
+        return slot
+
+    def add(self, transaction_id, transaction_code, account, amount, time_utc):
+        """Index one transaction; `time_utc` is POSIX seconds."""
+        if self._base is None:
+            self._base = transaction_id
+        position = transaction_id - self._base
+        size = len(self._account_slots)
+        if position < 0 or position >= size + self._max_gap:
+            self._sparse[transaction_id] = TransactionRecord(transaction_id, transaction_code, account, amount,
+                                                             time_utc)
+            return
+        if position >= size:
+            grow = position + 1 - size
+            self._account_slots.extend(array('i', [_EMPTY]) * grow)
+            self._codes.extend(b'\0' * grow)
+            self._amounts.extend(array('d', [0.0]) * grow)
+            self._epochs.extend(array('q', [0]) * grow)
+        self._account_slots[position] = self._slot(account)
+        self._codes[position] = ord(transaction_code)
+        self._amounts[position] = amount
+        self._epochs[position] = time_utc
+
+    def __call__(self, account, transaction_code, amount, confirmation_code):
+        """Transaction listener interface, see Account.add_transaction_listener."""
+        _, raw_dt_utc, transaction_id = confirmation_code.rsplit('-', 2)
+        self.add(int(transaction_id), transaction_code, account, amount, timestamp_to_epoch(raw_dt_utc))
+
+    def _get(self, transaction_id):
+        if self._base is not None:
+            position = transaction_id - self._base
+            if 0 <= position < len(self._account_slots):
+                slot = self._account_slots[position]
+                if slot != _EMPTY:
+                    return TransactionRecord(transaction_id, chr(self._codes[position]), self._accounts[slot],
+                                             self._amounts[position], self._epochs[position])
+        return self._sparse.get(transaction_id)
+
+    def lookup(self, key):
+        """Find a transaction by id (int or str) or by full confirmation code.
+        Raises KeyError if it is not indexed."""
+        account_number = None
+        if isinstance(key, str) and '-' in key:
+            transaction_code_and_number, _, transaction_id = key.rsplit('-', 2)
+            account_number = transaction_code_and_number.split('-', 1)[-1]
+        else:
+            transaction_id = key
+        try:
+            record = self._get(int(transaction_id))
+        except ValueError:
+            raise KeyError(key) from None
+        if record is None or (account_number is not None and str(record.account.account_number) != account_number):
+            raise KeyError(key)
+        return record
+
+    def __contains__(self, key):
+        try:
+            self.lookup(key)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self):
+        return len(self._account_slots) - self._account_slots.count(_EMPTY) + len(self._sparse)
+
+    def attach(self):
+        if not self._attached:
+            Account.add_transaction_listener(self)
+            self._attached = True
+
+    def detach(self):
+        if self._attached:
+            Account.remove_transaction_listener(self)
+            self._attached = False
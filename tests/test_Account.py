@@ -28,7 +28,7 @@ class TestAccountClass(unittest.TestCase):
         msg = 'Four instance attributes are not defined.'
         actual = len([attr for attr in dir(self.a)
                       if not attr.startswith('_')])
-        expected = 16
+        expected = 21
         self.assertEqual(actual, expected, msg)
 
     def tearDown(self):
@@ -1069,6 +1069,36 @@ class TestStaticMethodParseConfirmationCode(unittest.TestCase):
         self.assertRaises(ValueError, self.a.__class__.parse_confirmation_code, 'D-A100-20220822200421-100',
                           preferred_time_zone=str)
 
+    def test_parse_confirmation_code_record_type_is_shared(self):
+        r1 = Account.parse_confirmation_code('D-A100-20190315145900-124')
+        r2 = Account.parse_confirmation_code('W-A100-20190315145901-125')
+        self.assertIs(type(r1), type(r2))
+        self.assertEqual(type(r1)._fields, ('account_number', 'transaction_code', 'transaction_id', 'time_utc', 'time'))
+
+    def test_parse_confirmation_code_values(self):
+        cases = [
+            ('D-140568-20190315145900-124', TimeZone(-7, 0, 'MST'),
+             ('140568', 'D', '124', '2019-03-15T14:59:00', '2019-03-15 07:59:00 (MST)')),
+            ('W-A100-20191231233000-7', TimeZone(1, 30, 'TZ'),
+             ('A100', 'W', '7', '2019-12-31T23:30:00', '2020-01-01 01:00:00 (TZ)')),
+            ('X-A100-20200301003000-8', TimeZone(-1, -30, 'TZ'),
+             ('A100', 'X', '8', '2020-03-01T00:30:00', '2020-02-29 23:00:00 (TZ)')),
+            ('I-A100-20200301003000-9', None,
+             ('A100', 'I', '9', '2020-03-01T00:30:00', '2020-03-01 00:30:00 (UTC)')),
+        ]
+        for conf_code, tz, expected in cases:
+            with self.subTest(conf_code=conf_code):
+                self.assertEqual(tuple(Account.parse_confirmation_code(conf_code, tz)), expected)
+
+    def test_parse_confirmation_code_invalid_datetime(self):
+        wrong_values = ['D-A100-2019031514590-1', 'D-A100-201903151459000-1', 'D-A100-2019031514590x-1',
+                        'D-A100-20190230145900-1', 'D-A100-20190315245900-1', 'D-A100-00000315145900-1',
+                        'D-A100-２０１９0315145900-1']
+        for entry in wrong_values:
+            with self.subTest(entry=entry):
+                self.assertRaisesRegex(ValueError, 'Invalid transaction datetime',
+                                       Account.parse_confirmation_code, entry)
+
     def test_function_attribute(self):
         self.assertTrue(hasattr(self.a, 'parse_confirmation_code'))
 
@@ -1238,6 +1268,108 @@ class TestPayInterest(unittest.TestCase):
         del self.b
 
 
+class TestDepositMany(unittest.TestCase):
+
+    def setUp(self):
+        Account.transaction_counter = itertools.count(100)
+        self.account_number = 'A100'
+        self.first_name = 'FIRST'
+        self.last_name = 'LAST'
+        self.tz = TimeZone(1, 30, 'TZ')
+        self.balance = 100.00
+        self.b = Account(self.account_number, self.first_name, self.last_name, self.tz, self.balance)
+
+    def test_deposit_many_is_method(self):
+        self.assertIsInstance(Account.__dict__['deposit_many'], types.FunctionType)
+
+    def test_deposit_many_easy(self):
+        self.b.deposit_many([100, 100, 100, 100])
+        self.assertEqual(self.b.balance, 500)
+
+    @patch("app.Account.datetime")
+    def test_deposit_many_confirmation_codes(self, mock_dt):
+        mock_dt.utcnow = Mock(return_value=datetime(2011, 3, 9, 8, 0, 0))
+        actual = self.b.deposit_many((10, 20.5, 30))
+        expected = ['D-A100-20110309080000-100', 'D-A100-20110309080000-101', 'D-A100-20110309080000-102']
+        self.assertEqual(actual, expected)
+        self.assertEqual(self.b.deposit(1), 'D-A100-20110309080000-103')
+
+    def test_deposit_many_empty(self):
+        self.assertEqual(self.b.deposit_many([]), [])
+        self.assertEqual(self.b.balance, 100)
+        self.assertEqual(next(Account.transaction_counter), 100)
+
+    def test_deposit_many_same_balance_as_deposit(self):
+        values = [0.1, 0.2, 0.3, 1.15, 7.77]
+        a = Account('A200', 'FIRST', 'LAST', self.tz, self.balance)
+        for value in values:
+            a.deposit(value)
+        self.b.deposit_many(values)
+        self.assertEqual(self.b.balance, a.balance)
+
+    def test_deposit_many_wrong_input_applies_nothing(self):
+        wrong_values = [[100, -100], [100, 'John'], [100, None], [0]]
+        for entry in wrong_values:
+            with self.subTest(entry=entry):
+                self.assertRaises(ValueError, self.b.deposit_many, entry)
+                self.assertEqual(self.b.balance, 100)
+
+    def tearDown(self):
+        del self.account_number
+        del self.first_name
+        del self.last_name
+        del self.tz
+        del self.balance
+        del self.b
+
+
+class TestWithdrawMany(unittest.TestCase):
+
+    def setUp(self):
+        Account.transaction_counter = itertools.count(100)
+        self.account_number = 'A100'
+        self.first_name = 'FIRST'
+        self.last_name = 'LAST'
+        self.tz = TimeZone(1, 30, 'TZ')
+        self.balance = 100.00
+        self.b = Account(self.account_number, self.first_name, self.last_name, self.tz, self.balance)
+
+    def test_withdraw_many_is_method(self):
+        self.assertIsInstance(Account.__dict__['withdraw_many'], types.FunctionType)
+
+    def test_withdraw_many_easy(self):
+        self.b.withdraw_many([25, 25])
+        self.assertEqual(self.b.balance, 50)
+
+    @patch("app.Account.datetime")
+    def test_withdraw_many_rejected(self, mock_dt):
+        mock_dt.utcnow = Mock(return_value=datetime(2011, 3, 9, 8, 0, 0))
+        actual = self.b.withdraw_many([60, 50, 40])
+        expected = ['W-A100-20110309080000-100', 'X-A100-20110309080000-101', 'W-A100-20110309080000-102']
+        self.assertEqual(actual, expected)
+        self.assertEqual(self.b.balance, 0)
+
+    def test_withdraw_many_same_codes_as_withdrawal(self):
+        values = [30, 80, 70, 0.5]
+        a = Account('A100', 'FIRST', 'LAST', self.tz, self.balance)
+        single = [a.withdrawal(value)[0] for value in values]
+        batch = [code[0] for code in self.b.withdraw_many(values)]
+        self.assertEqual(batch, single)
+        self.assertEqual(self.b.balance, a.balance)
+
+    def test_withdraw_many_wrong_input_applies_nothing(self):
+        self.assertRaises(ValueError, self.b.withdraw_many, [10, -10])
+        self.assertEqual(self.b.balance, 100)
+
+    def tearDown(self):
+        del self.account_number
+        del self.first_name
+        del self.last_name
+        del self.tz
+        del self.balance
+        del self.b
+
+
 if __name__ == "__main__":
     unittest.main()
 
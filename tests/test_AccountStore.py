@@ -0,0 +1,90 @@
+"""For import to work correctly mark `Bank account Project` as Source Root"""
+import unittest
+import itertools
+from unittest.mock import patch, Mock
+from datetime import datetime
+from app.Account import Account
+from app.AccountStore import AccountStore, AccountView
+from app.TimeZone import TimeZone
+
+
+class TestAccountStore(unittest.TestCase):
+    def setUp(self):
+        Account.transaction_counter = itertools.count(100)
+        Account.set_interest_rate(0.5)
+        self.tz = TimeZone(1, 30, 'TZ')
+        self.store = AccountStore()
+        self.a = self.store.add('A100', 'FIRST', 'LAST', self.tz, 100.00)
+
+    def test_view_is_account(self):
+        self.assertIsInstance(self.a, Account)
+        self.assertIsInstance(self.a, AccountView)
+
+    def test_view_properties(self):
+        self.assertEqual(self.a.account_number, 'A100')
+        self.assertEqual(self.a.first_name, 'FIRST')
+        self.assertEqual(self.a.last_name, 'LAST')
+        self.assertEqual(self.a.full_name, 'FIRST LAST')
+        self.assertEqual(self.a.timezone, self.tz)
+        self.assertEqual(self.a.balance, 100.00)
+
+    def test_view_equals_account(self):
+        self.assertEqual(self.a, Account('A100', 'FIRST', 'LAST', self.tz, 100.00))
+
+    def test_default_timezone(self):
+        b = self.store.add('A200', 'FIRST', 'LAST', initial_balance=10)
+        self.assertEqual(b.timezone, TimeZone(0, 0, 'UTC'))
+
+    @patch("app.Account.datetime")
+    def test_transactions_write_through_to_store(self, mock_dt):
+        mock_dt.utcnow = Mock(return_value=datetime(2011, 3, 9, 8, 0, 0))
+        self.assertEqual(self.a.deposit(100), 'D-A100-20110309080000-100')
+        self.assertEqual(self.a.withdrawal(50), 'W-A100-20110309080000-101')
+        self.assertEqual(self.a.withdrawal(500), 'X-A100-20110309080000-102')
+        self.assertEqual(self.a.pay_interest(), 'I-A100-20110309080000-103')
+        self.assertEqual(self.store['A100'].balance, 150.75)
+        self.assertEqual(self.store.balances[self.store.row_of('A100')], 150.75)
+
+    def test_setters_write_through_to_store(self):
+        self.a.first_name = 'John'
+        self.a.last_name = 'Cleese'
+        self.a.timezone = TimeZone(-7, 0, 'MST')
+        b = self.store['A100']
+        self.assertEqual(b.full_name, 'John Cleese')
+        self.assertEqual(b.timezone, TimeZone(-7, 0, 'MST'))
+
+    def test_timezones_are_shared(self):
+        self.store.add('A200', 'FIRST', 'LAST', TimeZone(1, 30, 'TZ'), 10)
+        self.store.add('A300', 'FIRST', 'LAST', TimeZone(-7, 0, 'MST'), 10)
+        self.assertEqual(list(self.store._timezone_codes), [0, 0, 1])
+
+    def test_wrong_input(self):
+        self.assertRaises(ValueError, self.store.add, 'A100', 'FIRST', 'LAST', self.tz, 10)
+        self.assertRaises(ValueError, self.store.add, 'A200', '', 'LAST', self.tz, 10)
+        self.assertRaises(ValueError, self.store.add, 'A200', 'FIRST', None, self.tz, 10)
+        self.assertRaises(ValueError, self.store.add, 'A200', 'FIRST', 'LAST', 'TZ', 10)
+        self.assertRaises(ValueError, self.store.add, 'A200', 'FIRST', 'LAST', self.tz, -10)
+        self.assertEqual(len(self.store), 1)
+        with self.assertRaises(ValueError):
+            self.a.first_name = ''
+
+    def test_balances_are_read_only(self):
+        with self.assertRaises(TypeError):
+            self.store.balances[0] = 1000.0
+
+    def test_container_protocol(self):
+        self.store.add_account(Account('A200', 'Daniel', 'Ivanov', TimeZone(-1, 30, 'TZ'), 1000.00))
+        self.assertEqual(len(self.store), 2)
+        self.assertIn('A200', self.store)
+        self.assertNotIn('A300', self.store)
+        self.assertEqual([a.account_number for a in self.store], ['A100', 'A200'])
+        self.assertRaises(KeyError, self.store.__getitem__, 'A300')
+
+    def tearDown(self):
+        del self.tz
+        del self.store
+        del self.a
+
+
+if __name__ == "__main__":
+    unittest.main()
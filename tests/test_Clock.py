@@ -0,0 +1,98 @@
+"""For import to work correctly mark `Bank account Project` as Source Root"""
+import unittest
+import itertools
+import time
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+from app.Account import Account
+from app.Clock import CoarseClock, FakeClock
+from app.TimeZone import TimeZone
+
+
+class TestFakeClock(unittest.TestCase):
+    def test_start_from_datetime(self):
+        self.assertEqual(FakeClock(datetime(1970, 1, 1, 0, 1, 0))(), 60)
+        self.assertEqual(FakeClock(datetime(1970, 1, 1, 0, 1, 0, tzinfo=timezone.utc))(), 60)
+
+    def test_set_and_advance(self):
+        fake = FakeClock(10)
+        fake.advance(1.5)
+        self.assertEqual(fake(), 11.5)
+        fake.set(100)
+        self.assertEqual(fake(), 100)
+
+    def test_wrong_input(self):
+        self.assertRaises(ValueError, FakeClock, '2019')
+
+
+class TestCoarseClock(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeClock(datetime(2019, 3, 15, 14, 59, 0))
+        self.clock = CoarseClock(self.fake)
+
+    def test_utc_timestamp(self):
+        self.assertEqual(self.clock.utc_timestamp(), '20190315145900')
+        self.fake.advance(0.999)
+        self.assertEqual(self.clock.utc_timestamp(), '20190315145900')
+        self.fake.advance(0.001)
+        self.assertEqual(self.clock.utc_timestamp(), '20190315145901')
+        self.fake.advance(86400)
+        self.assertEqual(self.clock.utc_timestamp(), '20190316145901')
+
+    def test_formats_once_per_second(self):
+        source = Mock(return_value=1552661940.25)
+        clock = CoarseClock(source)
+        with patch('app.Clock.time.strftime', wraps=time.strftime) as strftime:
+            for _ in range(100):
+                clock.utc_timestamp()
+            self.assertEqual(strftime.call_count, 1)
+        self.assertEqual(source.call_count, 100)
+
+    def test_default_time_source_matches_utcnow(self):
+        before = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+        actual = CoarseClock().utc_timestamp()
+        after = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+        self.assertTrue(before <= actual <= after)
+
+    def test_wrong_input(self):
+        self.assertRaises(ValueError, CoarseClock, 'now')
+
+    def tearDown(self):
+        del self.fake
+        del self.clock
+
+
+class TestAccountSetClock(unittest.TestCase):
+    def setUp(self):
+        Account.transaction_counter = itertools.count(100)
+        self.fake = FakeClock(datetime(2019, 3, 15, 14, 59, 0))
+        Account.set_clock(CoarseClock(self.fake))
+        self.a = Account('140568', 'FIRST', 'LAST', TimeZone(-7, 0, 'MST'), 100.00)
+
+    def test_set_clock_is_class_method(self):
+        self.assertIsInstance(Account.__dict__['set_clock'], classmethod)
+
+    def test_confirmation_codes_use_clock(self):
+        self.assertEqual(self.a.deposit(50), 'D-140568-20190315145900-100')
+        self.fake.advance(61)
+        self.assertEqual(self.a.withdrawal(500), 'X-140568-20190315150001-101')
+        self.assertEqual(self.a.deposit_many([1, 2]),
+                         ['D-140568-20190315150001-102', 'D-140568-20190315150001-103'])
+
+    def test_reset_clock(self):
+        Account.set_clock(None)
+        self.assertIsNone(Account._clock)
+        self.assertNotIn('20190315', self.a.deposit(50))
+
+    def test_wrong_input(self):
+        self.assertRaises(ValueError, Account.set_clock, FakeClock())
+        self.assertRaises(ValueError, Account.set_clock, 'clock')
+
+    def tearDown(self):
+        Account.set_clock(None)
+        del self.fake
+        del self.a
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""For import to work correctly mark `Bank account Project` as Source Root"""
+import os
+import tempfile
+import unittest
+from app.Account import Account
+from app.ConfirmationReader import (ConfirmationBatch, InvalidConfirmation, iter_confirmation_batches,
+                                    iter_confirmation_codes)
+from app.TimeZone import TimeZone
+
+
+class TestIterConfirmationCodes(unittest.TestCase):
+    def setUp(self):
+        self.codes = ['D-A100-20190315145900-124', 'W-A100-20190315145901-125',
+                      'X-A200-20190315145902-126', 'I-A300-20190315145903-127']
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            f.write('\n'.join(self.codes[:2]) + '\n')
+            f.write('not-a-code\n')
+            f.write('\n')
+            f.write('\n'.join(self.codes[2:]))  # no trailing newline
+
+    def test_file_matches_parse_confirmation_code(self):
+        errors = []
+        actual = list(iter_confirmation_codes(self.path, on_error=errors.append))
+        expected = [Account.parse_confirmation_code(code) for code in self.codes]
+        self.assertEqual(actual, expected)
+
+    def test_small_chunks(self):
+        errors = []
+        actual = list(iter_confirmation_codes(self.path, on_error=errors.append, chunk_size=7))
+        self.assertEqual(actual, [Account.parse_confirmation_code(code) for code in self.codes])
+        self.assertEqual(errors[0][:3], (3, 52, 'not-a-code'))
+
+    def test_malformed_lines_are_reported(self):
+        errors = []
+        list(iter_confirmation_codes(self.path, on_error=errors.append))
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], InvalidConfirmation)
+        self.assertEqual(errors[0].line_number, 3)
+        self.assertEqual(errors[0].offset, 52)
+        self.assertEqual(errors[0].line, 'not-a-code')
+
+    def test_malformed_lines_warn_without_callback(self):
+        with self.assertWarnsRegex(UserWarning, 'line 3'):
+            records = list(iter_confirmation_codes(self.path))
+        self.assertEqual(len(records), 4)
+
+    def test_iterable_source(self):
+        tz = TimeZone(-7, 0, 'MST')
+        errors = []
+        lines = [self.codes[0] + '\n', b'D-A100-20190345145900-1', self.codes[1]]
+        actual = list(iter_confirmation_codes(lines, tz, on_error=errors.append))
+        self.assertEqual(actual, [Account.parse_confirmation_code(code, tz) for code in self.codes[:2]])
+        self.assertEqual(errors[0].line_number, 2)
+        self.assertIsNone(errors[0].offset)
+
+    def test_non_ascii_bytes(self):
+        errors = []
+        self.assertEqual(list(iter_confirmation_codes([b'\xff\xfe'], on_error=errors.append)), [])
+        self.assertEqual(errors[0].line_number, 1)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+
+class TestIterConfirmationBatches(unittest.TestCase):
+    def setUp(self):
+        self.codes = [f'D-A{i}-20190315145900-{100 + i}' for i in range(5)]
+
+    def test_batches(self):
+        batches = list(iter_confirmation_batches(self.codes, batch_size=2))
+        self.assertEqual(len(batches), 3)
+        self.assertIsInstance(batches[0], ConfirmationBatch)
+        self.assertEqual(batches[0].account_numbers, ['A0', 'A1'])
+        self.assertEqual(batches[2].transaction_ids, ['104'])
+        self.assertEqual(batches[1].times_utc, ['2019-03-15T14:59:00'] * 2)
+        self.assertEqual(batches[1].times, ['2019-03-15 14:59:00 (UTC)'] * 2)
+
+    def test_empty(self):
+        self.assertEqual(list(iter_confirmation_batches([])), [])
+
+    def test_wrong_batch_size(self):
+        with self.assertRaises(ValueError):
+            next(iter_confirmation_batches(self.codes, batch_size=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""For import to work correctly mark `Bank account Project` as Source Root"""
+import unittest
+import itertools
+from unittest.mock import patch, Mock
+from datetime import datetime
+from app.Account import Account
+from app.AccountStore import AccountStore
+from app.InterestEngine import InterestRun, pay_interest_all
+from app.TimeZone import TimeZone
+
+
+class TestPayInterestAll(unittest.TestCase):
+    def setUp(self):
+        Account.transaction_counter = itertools.count(100)
+        Account.set_interest_rate(0.5)
+        self.tz = TimeZone(1, 30, 'TZ')
+        self.store = AccountStore()
+        for number, balance in (('A100', 1000.00), ('A200', 200.00), ('A300', 33.33)):
+            self.store.add(number, 'FIRST', 'LAST', self.tz, balance)
+
+    def test_store_balances_match_pay_interest(self):
+        expected = []
+        for a in self.store:
+            single = Account(a.account_number, 'FIRST', 'LAST', self.tz, a.balance)
+            single.pay_interest()
+            expected.append(single.balance)
+        pay_interest_all(self.store)
+        self.assertEqual(list(self.store.balances), expected)
+
+    def test_account_list(self):
+        accounts = [Account('A100', 'FIRST', 'LAST', self.tz, 1000.00),
+                    Account('A200', 'FIRST', 'LAST', self.tz, 2000.00)]
+        run = pay_interest_all(accounts)
+        self.assertEqual([a.balance for a in accounts], [1005.0, 2010.0])
+        self.assertEqual(len(run), 2)
+
+    @patch("app.Account.datetime")
+    def test_confirmation_codes(self, mock_dt):
+        mock_dt.utcnow = Mock(return_value=datetime(2011, 3, 9, 8, 0, 0))
+        run = pay_interest_all(self.store)
+        self.assertIsInstance(run, InterestRun)
+        self.assertEqual(list(run.transaction_ids), [100, 101, 102])
+        self.assertEqual(run[0], 'I-A100-20110309080000-100')
+        self.assertEqual(run[-1], 'I-A300-20110309080000-102')
+        self.assertEqual(run[1:], ['I-A200-20110309080000-101', 'I-A300-20110309080000-102'])
+        self.assertEqual(run.confirmation_code('A200'), 'I-A200-20110309080000-101')
+        self.assertEqual(list(run), run[:])
+        self.assertEqual(next(Account.transaction_counter), 103)
+
+    def test_codes_parse(self):
+        run = pay_interest_all(self.store)
+        parsed = Account.parse_confirmation_code(run[2])
+        self.assertEqual((parsed.account_number, parsed.transaction_code, parsed.transaction_id),
+                         ('A300', 'I', '102'))
+
+    def test_run_is_not_affected_by_store_growth(self):
+        run = pay_interest_all(self.store)
+        self.store.add('A400', 'FIRST', 'LAST', self.tz, 10)
+        self.assertEqual(len(run), 3)
+        self.assertRaises(IndexError, run.__getitem__, 3)
+        self.assertRaises(KeyError, run.confirmation_code, 'A400')
+
+    def test_interest_rate_is_recorded(self):
+        Account.set_interest_rate(1)
+        run = pay_interest_all(self.store)
+        self.assertEqual(run.interest_rate, 1)
+        self.assertEqual(self.store['A100'].balance, 1010.0)
+
+    def test_empty(self):
+        run = pay_interest_all([])
+        self.assertEqual(len(run), 0)
+        self.assertEqual(list(run), [])
+
+    def tearDown(self):
+        Account.set_interest_rate(0.5)
+        del self.tz
+        del self.store
+
+
+if __name__ == "__main__":
+    unittest.main()
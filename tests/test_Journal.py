@@ -0,0 +1,126 @@
+"""For import to work correctly mark `Bank account Project` as Source Root"""
+import os
+import time
+import tempfile
+import itertools
+import unittest
+from unittest.mock import patch
+from app.Account import Account
+from app.AccountStore import AccountStore
+from app.InterestEngine import pay_interest_all
+from app.Journal import JournalRecord, TransactionJournal, read_journal
+from app.TimeZone import TimeZone
+
+
+class TestTransactionListeners(unittest.TestCase):
+    def setUp(self):
+        Account.transaction_counter = itertools.count(100)
+        Account.set_interest_rate(0.5)
+        self.events = []
+        self.listener = lambda *args: self.events.append(args)
+        Account.add_transaction_listener(self.listener)
+        self.a = Account('A100', 'FIRST', 'LAST', TimeZone(1, 30, 'TZ'), 100.00)
+
+    def test_all_transactions_are_reported(self):
+        self.a.deposit(50)
+        self.a.withdrawal(500)
+        self.a.withdrawal(50)
+        self.a.pay_interest()
+        self.a.deposit_many([1, 2])
+        self.a.withdraw_many([1, 1000])
+        self.assertEqual([(e[1], e[2]) for e in self.events],
+                         [('D', 50), ('X', 500), ('W', 50), ('I', 0.5), ('D', 1), ('D', 2), ('W', 1), ('X', 1000)])
+        self.assertTrue(all(e[0] is self.a for e in self.events))
+        self.assertEqual([e[3].rsplit('-', 1)[1] for e in self.events], [str(i) for i in range(100, 108)])
+
+    def test_bulk_interest_is_reported(self):
+        store = AccountStore()
+        store.add('A200', 'FIRST', 'LAST', initial_balance=1000)
+        run = pay_interest_all(store)
+        self.assertEqual([(e[0].account_number, e[1], e[2], e[3]) for e in self.events],
+                         [('A200', 'I', 5.0, run[0])])
+
+    def test_remove_listener(self):
+        Account.remove_transaction_listener(self.listener)
+        self.a.deposit(50)
+        self.assertEqual(self.events, [])
+        self.assertRaises(ValueError, Account.remove_transaction_listener, self.listener)
+        Account.add_transaction_listener(self.listener)
+
+    def test_wrong_input(self):
+        self.assertRaises(ValueError, Account.add_transaction_listener, 'listener')
+
+    def tearDown(self):
+        Account.remove_transaction_listener(self.listener)
+        del self.events
+        del self.a
+
+
+class TestTransactionJournal(unittest.TestCase):
+    def setUp(self):
+        Account.transaction_counter = itertools.count(100)
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.a = Account('A100', 'FIRST', 'LAST', TimeZone(1, 30, 'TZ'), 100.00)
+
+    def test_journal_round_trip(self):
+        with TransactionJournal(self.path) as journal:
+            journal.attach()
+            codes = [self.a.deposit(50), self.a.withdrawal(500), self.a.pay_interest()]
+        records = list(read_journal(self.path))
+        self.assertIsInstance(records[0], JournalRecord)
+        self.assertEqual([r.confirmation_code for r in records], codes)
+        self.assertEqual(records[0][:4], ('D', 'A100', 100, 50.0))
+        self.assertEqual(records[1].transaction_code, 'X')
+        self.assertEqual(records[2].amount, 0.75)
+        # closing detaches the journal
+        self.a.deposit(1)
+        self.assertEqual(len(list(read_journal(self.path))), 3)
+
+    def test_group_commit(self):
+        with patch('app.Journal.os.fsync') as mock_fsync:
+            journal = TransactionJournal(self.path, commit_every=10)
+            journal.attach()
+            self.a.deposit_many([1] * 25)
+            self.assertEqual(mock_fsync.call_count, 2)
+            self.assertEqual(journal.pending, 5)
+            self.assertEqual(len(list(read_journal(self.path))), 20)
+            journal.close()
+            self.assertEqual(mock_fsync.call_count, 3)
+        self.assertEqual(len(list(read_journal(self.path))), 25)
+
+    def test_commit_interval(self):
+        journal = TransactionJournal(self.path, commit_every=1000, commit_interval=0.01)
+        journal.append('D-A100-20190315145900-100', 10)
+        deadline = time.monotonic() + 5
+        while journal.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(journal.pending, 0)
+        journal.close()
+
+    def test_read_from_offset_and_torn_line(self):
+        with TransactionJournal(self.path) as journal:
+            journal.append('D-A100-20190315145900-100', 10)
+            offset = journal.tell()
+            journal.append('W-A100-20190315145900-101', 5)
+        with open(self.path, 'ab') as f:
+            f.write(b'D-A100-2019031514')
+        records = list(read_journal(self.path, offset))
+        self.assertEqual([r.transaction_id for r in records], [101])
+
+    def test_closed_journal(self):
+        journal = TransactionJournal(self.path)
+        journal.close()
+        self.assertRaises(ValueError, journal.append, 'D-A100-20190315145900-100', 10)
+
+    def test_wrong_input(self):
+        self.assertRaises(ValueError, TransactionJournal, self.path, commit_every=0)
+        self.assertRaises(ValueError, TransactionJournal, self.path, commit_interval=0)
+
+    def tearDown(self):
+        os.remove(self.path)
+        del self.a
+
+
+if __name__ == "__main__":
+    unittest.main()
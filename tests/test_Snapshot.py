@@ -0,0 +1,115 @@
+"""For import to work correctly mark `Bank account Project` as Source Root"""
+import os
+import shutil
+import tempfile
+import itertools
+import unittest
+from app.Account import Account
+from app.AccountStore import AccountStore
+from app.Journal import TransactionJournal
+from app.Snapshot import Snapshot, checkpoint, read_snapshot, recover, write_snapshot
+from app.TimeZone import TimeZone
+
+
+class TestSnapshotFile(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'ledger.snapshot')
+        self.accounts = [Account('A100', 'FIRST', 'LAST', initial_balance=100.25),
+                         Account('Ü200', 'FIRST', 'LAST', initial_balance=0.1)]
+
+    def test_round_trip(self):
+        write_snapshot(self.path, self.accounts, journal_offset=42, next_transaction_id=1000)
+        self.assertEqual(read_snapshot(self.path), Snapshot(42, 1000, {'A100': 100.25, 'Ü200': 0.1}))
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+    def test_dict_and_store(self):
+        store = AccountStore()
+        store.add('A300', 'FIRST', 'LAST', initial_balance=3)
+        write_snapshot(self.path, store, next_transaction_id=1)
+        self.assertEqual(read_snapshot(self.path).balances, {'A300': 3})
+        write_snapshot(self.path, {a.account_number: a for a in self.accounts}, next_transaction_id=1)
+        self.assertEqual(read_snapshot(self.path).balances, {'A100': 100.25, 'Ü200': 0.1})
+
+    def test_high_water_mark_from_counter(self):
+        Account.transaction_counter = itertools.count(500)
+        write_snapshot(self.path, self.accounts)
+        self.assertEqual(read_snapshot(self.path).next_transaction_id, 500)
+        self.assertEqual(next(Account.transaction_counter), 501)
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'garbage-garbage-garbage-garbage')
+        self.assertRaises(ValueError, read_snapshot, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+
+class TestRecover(unittest.TestCase):
+    def setUp(self):
+        Account.transaction_counter = itertools.count(100)
+        Account.set_interest_rate(0.5)
+        self.dir = tempfile.mkdtemp()
+        self.snapshot_path = os.path.join(self.dir, 'ledger.snapshot')
+        self.journal_path = os.path.join(self.dir, 'ledger.journal')
+        self.tz = TimeZone(1, 30, 'TZ')
+
+    def new_accounts(self):
+        return {number: Account(number, 'FIRST', 'LAST', self.tz, 100.00) for number in ('A100', 'A200')}
+
+    def test_snapshot_plus_journal_tail(self):
+        live = self.new_accounts()
+        with TransactionJournal(self.journal_path) as journal:
+            journal.attach()
+            live['A100'].deposit(50)
+            live['A200'].withdrawal(30)
+            checkpoint(self.snapshot_path, live, journal)
+            live['A100'].pay_interest()
+            live['A200'].withdrawal(1000)
+            live['A200'].withdraw_many([10, 20])
+        last_id = int(live['A200'].deposit(1).rsplit('-', 1)[1])  # not journaled any more
+        live['A200'].withdrawal(1)
+
+        restarted = self.new_accounts()
+        Account.transaction_counter = itertools.count(100)
+        result = recover(restarted, self.snapshot_path, self.journal_path)
+        self.assertEqual(result.snapshot_accounts, 2)
+        self.assertEqual(result.replayed, 4)
+        self.assertEqual(result.unknown_accounts, set())
+        self.assertEqual(restarted['A100'].balance, live['A100'].balance)
+        self.assertEqual(restarted['A200'].balance, 40.0)
+        self.assertEqual(next(Account.transaction_counter), last_id)
+
+    def test_journal_only(self):
+        live = self.new_accounts()
+        with TransactionJournal(self.journal_path) as journal:
+            journal.attach()
+            live['A100'].deposit(50)
+            live['A300'] = Account('A300', 'FIRST', 'LAST', self.tz, 100.00)
+            live['A300'].deposit(50)
+        restarted = self.new_accounts()
+        result = recover(restarted, self.snapshot_path, self.journal_path, restore_counter=False)
+        self.assertEqual(restarted['A100'].balance, 150)
+        self.assertEqual(result.unknown_accounts, {'A300'})
+        self.assertEqual(result.next_transaction_id, 102)
+
+    def test_store(self):
+        store = AccountStore()
+        store.add('A100', 'FIRST', 'LAST', self.tz, 100.00)
+        write_snapshot(self.snapshot_path, [Account('A100', 'FIRST', 'LAST', self.tz, 7.5)], next_transaction_id=9)
+        recover(store, self.snapshot_path, None)
+        self.assertEqual(store['A100'].balance, 7.5)
+        self.assertEqual(next(Account.transaction_counter), 9)
+
+    def test_nothing_to_recover(self):
+        result = recover({}, self.snapshot_path, self.journal_path)
+        self.assertEqual(result.replayed, 0)
+        self.assertEqual(next(Account.transaction_counter), 100)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""For import to work correctly mark `Bank account Project` as Source Root"""
+import unittest
+import threading
+from datetime import datetime
+from app.Account import Account
+from app.Clock import FakeClock
+from app.SnowflakeId import MAX_SEQUENCE, SnowflakeIdGenerator, decode_transaction_id
+from app.TimeZone import TimeZone
+
+
+class TestSnowflakeIdGenerator(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeClock(datetime(2023, 5, 1, 12, 0, 0))
+        self.node = SnowflakeIdGenerator(node_id=5, time_source=self.fake)
+
+    def test_fields_round_trip(self):
+        first, second = next(self.node), next(self.node)
+        self.assertEqual(decode_transaction_id(first), (int(self.fake() * 1000), 5, 0))
+        self.assertEqual(decode_transaction_id(str(second)), (int(self.fake() * 1000), 5, 1))
+
+    def test_nodes_do_not_collide(self):
+        other = SnowflakeIdGenerator(node_id=6, time_source=self.fake)
+        ids = [next(self.node) for _ in range(100)] + [next(other) for _ in range(100)]
+        self.assertEqual(len(set(ids)), 200)
+
+    def test_ids_sort_by_time(self):
+        other = SnowflakeIdGenerator(node_id=1, time_source=self.fake)
+        early = next(self.node)
+        self.fake.advance(0.001)
+        late = next(other)
+        self.assertLess(early, late)
+
+    def test_sequence_overflow_and_clock_going_back(self):
+        ids = [next(self.node) for _ in range(MAX_SEQUENCE + 2)]
+        self.assertEqual(ids, sorted(set(ids)))
+        self.assertEqual(decode_transaction_id(ids[-1]).sequence, 0)
+        self.fake.advance(-10)
+        self.assertGreater(next(self.node), ids[-1])
+
+    def test_threads(self):
+        results = []
+
+        def work():
+            results.extend(next(self.node) for _ in range(2000))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(set(results)), 8000)
+
+    def test_reserve(self):
+        ids = self.node.reserve(3)
+        self.assertEqual([decode_transaction_id(i).sequence for i in ids], [0, 1, 2])
+
+    def test_wrong_input(self):
+        self.assertRaises(ValueError, SnowflakeIdGenerator, -1)
+        self.assertRaises(ValueError, SnowflakeIdGenerator, 1024)
+        self.assertRaises(ValueError, SnowflakeIdGenerator, 1, 'now')
+        self.assertRaises(ValueError, next, SnowflakeIdGenerator(1, FakeClock(datetime(2019, 1, 1))))
+        self.assertRaises(ValueError, decode_transaction_id, -1)
+
+    def tearDown(self):
+        del self.fake
+        del self.node
+
+
+class TestParseSnowflakeConfirmationCode(unittest.TestCase):
+    def setUp(self):
+        self.saved_counter = Account.transaction_counter
+        Account.transaction_counter = SnowflakeIdGenerator(node_id=7)
+        self.a = Account('A100', 'FIRST', 'LAST', TimeZone(1, 30, 'TZ'), 100.00)
+
+    def test_node_and_sequence(self):
+        codes = self.a.deposit_many([1, 2])
+        parsed = [Account.parse_confirmation_code(code) for code in codes]
+        self.assertEqual([p.node for p in parsed], [7, 7])
+        self.assertEqual(parsed[1].sequence, parsed[0].sequence + 1)
+        self.assertLess(int(parsed[0].transaction_id), int(parsed[1].transaction_id))
+
+    def test_record_is_still_five_fields(self):
+        parsed = Account.parse_confirmation_code(self.a.deposit(1))
+        self.assertEqual(len(parsed), 5)
+
+    def tearDown(self):
+        Account.transaction_counter = self.saved_counter
+        del self.a
+
+
+if __name__ == "__main__":
+    unittest.main()
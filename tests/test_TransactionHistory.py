@@ -0,0 +1,86 @@
+"""For import to work correctly mark `Bank account Project` as Source Root"""
+import itertools
+import unittest
+from datetime import datetime, timezone
+from app.Account import Account
+from app.Clock import CoarseClock, FakeClock
+from app.TimeZone import TimeZone
+from app.TransactionHistory import HistoryEntry, TransactionHistory, TransactionHistoryRecorder
+
+
+class TestTransactionHistory(unittest.TestCase):
+    def setUp(self):
+        self.history = TransactionHistory()
+        for epoch, code, amount, transaction_id in ((10, 'D', 100.0, 1), (20, 'W', 5.0, 2), (30, 'W', 7.0, 3),
+                                                    (40, 'D', 1.0, 4), (50, 'X', 900.0, 5)):
+            self.history.append(epoch, code, amount, transaction_id)
+
+    def test_query_by_code(self):
+        self.assertEqual(self.history.query(20, 30, 'W'), [HistoryEntry(20, 'W', 5.0, 2), HistoryEntry(30, 'W', 7.0, 3)])
+        self.assertEqual(self.history.query(21, 30, 'W'), [HistoryEntry(30, 'W', 7.0, 3)])
+        self.assertEqual(self.history.query(0, 100, 'I'), [])
+
+    def test_query_all_codes_sorted_by_time(self):
+        self.assertEqual([e.transaction_id for e in self.history.query(15, 45)], [2, 3, 4])
+        self.assertEqual([e.transaction_id for e in self.history], [1, 2, 3, 4, 5])
+        self.assertEqual(len(self.history), 5)
+
+    def test_open_ranges(self):
+        self.assertEqual([e.transaction_id for e in self.history.query(end=20)], [1, 2])
+        self.assertEqual([e.transaction_id for e in self.history.query(start=40)], [4, 5])
+
+    def test_out_of_order_append(self):
+        self.history.append(25, 'W', 3.0, 6)
+        self.assertEqual([e.transaction_id for e in self.history.query(transaction_code='W')], [2, 6, 3])
+
+    def test_datetime_bounds(self):
+        history = TransactionHistory()
+        history.append(datetime(2019, 3, 15, 14, 59, 0), 'D', 1.0, 1)
+        self.assertEqual(len(history.query(datetime(2019, 3, 15), datetime(2019, 3, 16))), 1)
+        self.assertEqual(len(history.query(datetime(2019, 3, 15, 15, tzinfo=timezone.utc))), 0)
+
+    def tearDown(self):
+        del self.history
+
+
+class TestTransactionHistoryRecorder(unittest.TestCase):
+    def setUp(self):
+        Account.transaction_counter = itertools.count(100)
+        self.fake = FakeClock(datetime(2019, 3, 15, 14, 59, 0))
+        Account.set_clock(CoarseClock(self.fake))
+        self.recorder = TransactionHistoryRecorder()
+        self.recorder.attach()
+        self.a = Account('A100', 'FIRST', 'LAST', TimeZone(1, 30, 'TZ'), 100.00)
+
+    def test_records_account_transactions(self):
+        self.a.deposit(50)
+        self.fake.advance(60)
+        self.a.withdrawal(20)
+        self.a.withdrawal(1000)
+        self.fake.advance(3600)
+        self.a.withdraw_many([1, 2])
+        withdrawals = self.recorder.query('A100', datetime(2019, 3, 15, 15, 0, 0), datetime(2019, 3, 15, 15, 59, 59),
+                                          transaction_code='W')
+        self.assertEqual(withdrawals, [HistoryEntry(self.fake() - 3600, 'W', 20, 101)])
+        self.assertEqual([e.transaction_code for e in self.recorder.query('A100')], ['D', 'W', 'X', 'W', 'W'])
+        self.assertEqual(len(self.recorder.history('A100')), 5)
+
+    def test_unknown_account(self):
+        self.assertEqual(self.recorder.query('A999'), [])
+        self.assertRaises(KeyError, self.recorder.history, 'A999')
+
+    def test_detach(self):
+        self.recorder.detach()
+        self.a.deposit(50)
+        self.assertEqual(self.recorder.query('A100'), [])
+
+    def tearDown(self):
+        self.recorder.detach()
+        Account.set_clock(None)
+        del self.fake
+        del self.recorder
+        del self.a
+
+
+if __name__ == "__main__":
+    unittest.main()
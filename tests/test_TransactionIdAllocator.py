@@ -0,0 +1,133 @@
+"""For import to work correctly mark `Bank account Project` as Source Root"""
+import os
+import pickle
+import tempfile
+import threading
+import itertools
+import unittest
+import multiprocessing
+from app.Account import Account
+from app.TimeZone import TimeZone
+from app.TransactionIdAllocator import (BlockIdAllocator, FileHighWaterMark, LocalHighWaterMark,
+                                        SharedHighWaterMark)
+
+
+def _draw_ids(allocator, count, queue):
+    queue.put([next(allocator) for _ in range(count)])
+
+
+class TestHighWaterMarks(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def test_local(self):
+        hwm = LocalHighWaterMark(100)
+        self.assertEqual(hwm.reserve(10), 100)
+        self.assertEqual(hwm.reserve(5), 110)
+        self.assertEqual(hwm.value, 115)
+
+    def test_shared(self):
+        hwm = SharedHighWaterMark(100)
+        self.assertEqual(hwm.reserve(10), 100)
+        self.assertEqual(hwm.value, 110)
+
+    def test_file_survives_new_instance(self):
+        hwm = FileHighWaterMark(self.path, start=500)
+        self.assertEqual(hwm.reserve(10), 500)
+        self.assertEqual(FileHighWaterMark(self.path).reserve(1), 510)
+        self.assertEqual(FileHighWaterMark(self.path).value, 511)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+
+class TestBlockIdAllocator(unittest.TestCase):
+    def setUp(self):
+        self.saved_counter = Account.transaction_counter
+
+    def test_next_like_itertools_count(self):
+        allocator = BlockIdAllocator(LocalHighWaterMark(100), block_size=3)
+        self.assertIs(iter(allocator), allocator)
+        self.assertEqual([next(allocator) for _ in range(7)], list(range(100, 107)))
+        self.assertEqual(allocator.high_water_mark.value, 109)
+
+    def test_reserve(self):
+        allocator = BlockIdAllocator(LocalHighWaterMark(100), block_size=3)
+        next(allocator)
+        self.assertEqual(allocator.reserve(4), range(103, 107))
+        self.assertEqual(next(allocator), 101)
+
+    def test_threads_get_unique_ids(self):
+        allocator = BlockIdAllocator(LocalHighWaterMark(0), block_size=50)
+        results = [[] for _ in range(8)]
+
+        def work(out):
+            out.extend(next(allocator) for _ in range(1000))
+
+        threads = [threading.Thread(target=work, args=(out,)) for out in results]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        ids = [i for out in results for i in out]
+        self.assertEqual(len(set(ids)), 8000)
+        for out in results:
+            self.assertEqual(out, sorted(out))
+
+    def test_processes_get_unique_ids(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            allocator = BlockIdAllocator(FileHighWaterMark(path), block_size=10)
+            next(allocator)  # parent holds a block, children must not reuse it
+            queue = multiprocessing.Queue()
+            workers = [multiprocessing.Process(target=_draw_ids, args=(allocator, 25, queue)) for _ in range(3)]
+            for w in workers:
+                w.start()
+            ids = [i for _ in workers for i in queue.get(timeout=30)]
+            for w in workers:
+                w.join()
+            ids += [next(allocator) for _ in range(9)]
+            self.assertEqual(len(ids), len(set(ids)))
+            self.assertNotIn(100, ids)
+        finally:
+            os.remove(path)
+
+    def test_pickle_drops_blocks(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            allocator = BlockIdAllocator(FileHighWaterMark(path), block_size=10)
+            next(allocator)
+            copy = pickle.loads(pickle.dumps(allocator))
+            self.assertEqual(next(copy), 110)
+        finally:
+            os.remove(path)
+
+    def test_account_uses_allocator(self):
+        Account.transaction_counter = BlockIdAllocator(LocalHighWaterMark(100), block_size=2)
+        a = Account('A100', 'FIRST', 'LAST', TimeZone(1, 30, 'TZ'), 100.00)
+        self.assertTrue(a.deposit(1).endswith('-100'))
+        codes = a.deposit_many([1, 2, 3])
+        self.assertEqual([code.rsplit('-', 1)[1] for code in codes], ['102', '103', '104'])
+        self.assertTrue(a.withdrawal(1).endswith('-101'))
+        self.assertTrue(a.pay_interest().endswith('-105'))
+
+    def test_wrong_input(self):
+        self.assertRaises(ValueError, BlockIdAllocator, block_size=0)
+        self.assertRaises(ValueError, BlockIdAllocator, block_size=1.5)
+
+    def tearDown(self):
+        Account.transaction_counter = self.saved_counter
+
+
+class TestAccountReserveTransactionIds(unittest.TestCase):
+    def test_itertools_count(self):
+        Account.transaction_counter = itertools.count(100)
+        self.assertEqual(list(Account._reserve_transaction_ids(3)), [100, 101, 102])
+        self.assertEqual(next(Account.transaction_counter), 103)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""For import to work correctly mark `Bank account Project` as Source Root"""
+import itertools
+import unittest
+from datetime import datetime
+from app.Account import Account
+from app.Clock import CoarseClock, FakeClock
+from app.SnowflakeId import SnowflakeIdGenerator
+from app.TimeZone import TimeZone
+from app.TransactionIndex import TransactionIndex, TransactionRecord
+
+
+class TestTransactionIndex(unittest.TestCase):
+    def setUp(self):
+        self.saved_counter = Account.transaction_counter
+        Account.transaction_counter = itertools.count(100)
+        self.fake = FakeClock(datetime(2019, 3, 15, 14, 59, 0))
+        Account.set_clock(CoarseClock(self.fake))
+        self.index = TransactionIndex(max_gap=100)
+        self.index.attach()
+        self.tz = TimeZone(-7, 0, 'MST')
+        self.a = Account('140568', 'FIRST', 'LAST', self.tz, 100.00)
+        self.b = Account('A200', 'FIRST', 'LAST', self.tz, 100.00)
+
+    def test_lookup_by_confirmation_code(self):
+        code = self.a.deposit(50)
+        record = self.index.lookup(code)
+        self.assertIsInstance(record, TransactionRecord)
+        self.assertEqual(record, TransactionRecord(100, 'D', self.a, 50.0, int(self.fake())))
+        self.assertIs(record.account, self.a)
+
+    def test_lookup_by_id(self):
+        self.a.deposit(50)
+        self.b.withdrawal(500)
+        self.assertEqual(self.index.lookup(101).transaction_code, 'X')
+        self.assertIs(self.index.lookup('101').account, self.b)
+        self.assertEqual(len(self.index), 2)
+
+    def test_missing(self):
+        code = self.a.deposit(50)
+        self.assertRaises(KeyError, self.index.lookup, 99)
+        self.assertRaises(KeyError, self.index.lookup, 101)
+        self.assertRaises(KeyError, self.index.lookup, 'John')
+        self.assertRaises(KeyError, self.index.lookup, code.replace('140568', 'A200'))
+        self.assertIn(code, self.index)
+        self.assertNotIn(5000, self.index)
+
+    def test_gaps_and_sparse_ids(self):
+        self.a.deposit(1)
+        Account.transaction_counter = itertools.count(150)
+        self.a.deposit(2)
+        Account.transaction_counter = itertools.count(10 ** 9)
+        self.a.deposit(3)
+        Account.transaction_counter = itertools.count(50)
+        self.a.deposit(4)
+        self.assertEqual([self.index.lookup(i).amount for i in (100, 150, 10 ** 9, 50)], [1, 2, 3, 4])
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(len(self.index._sparse), 2)
+
+    def test_snowflake_ids(self):
+        Account.transaction_counter = SnowflakeIdGenerator(node_id=3)
+        codes = self.a.withdraw_many([10, 20])
+        self.assertEqual([self.index.lookup(code).amount for code in codes], [10, 20])
+
+    def test_detach(self):
+        self.index.detach()
+        code = self.a.deposit(50)
+        self.assertNotIn(code, self.index)
+
+    def tearDown(self):
+        self.index.detach()
+        Account.set_clock(None)
+        Account.transaction_counter = self.saved_counter
+        del self.fake
+        del self.index
+        del self.tz
+        del self.a
+        del self.b
+
+
+if __name__ == "__main__":
+    unittest.main()